@@ -37,11 +37,32 @@ List of functions
 
 * getAxSize_
 * curlyBrace_
+* curlyBraces_
 
 """
 
+import math
+
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
+
+try:
+    from numba import njit
+
+except ImportError:
+
+    def njit(*args, **kwargs):
+        # numba is optional, without it the kernel runs as plain numpy
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# from matplotlib 3.11 add_collection queues a lazy autoscale by itself, like ax.plot
+_MPL_LAZY_COLLECTION_AUTOSCALE = tuple(getattr(matplotlib, "__version_info__", (0, 0))[:2]) >= (3, 11)
 
 
 def getAxSize(fig, ax):
@@ -55,6 +76,9 @@ def getAxSize(fig, ax):
     fig : matplotlib figure object
         The of the target axes.
 
+        It is not used by the calculation any more, but kept so that existing
+        calls still work.
+
     ax : matplotlib axes object
         The target axes.
 
@@ -71,15 +95,296 @@ def getAxSize(fig, ax):
     https://stackoverflow.com/questions/19306510/determine-matplotlib-axis-size-in-pixels
     """
 
-    bbox = ax.get_window_extent().transformed(fig.dpi_scale_trans.inverted())
-    ax_width, ax_height = bbox.width, bbox.height
-    ax_width *= fig.dpi
-    ax_height *= fig.dpi
+    # the window extent is already in pixels, no need to go through inches
+    bbox = ax.get_window_extent()
+
+    return bbox.width, bbox.height
+
+
+def _check_arc_num(int_arc_num):
+    """
+    Check the number of points per arc, each arc needs at least its two end points.
+    """
+
+    int_arc_num = int(int_arc_num)
+
+    if int_arc_num < 2:
+        raise ValueError("int_arc_num must be at least 2, got %d" % int_arc_num)
+
+    return int_arc_num
+
+
+def _get_ax_trans(ax, bool_auto):
+    """
+    Get the transform from the data coordinates of the given axes to the linear space the bracket is built in.
+
+    With bool_auto on this is ax.transData, i.e., the bracket is built in pixels,
+    so different axes scales and log (or any other) axis scales are all taken
+    care of by matplotlib. With bool_auto off it is ax.transScale, which only
+    undoes the axis scales and keeps the data units for "equal" axes.
+
+    Note that ax.transScale maps log axes to log10 units, the same space
+    matplotlib itself lays log axes out in. Before the transforms were used,
+    the bracket was built in natural log units, so on log axes with bool_auto
+    off the bracket shape differs from older versions. This is intended.
+
+    Likewise, with bool_auto on, ax.transData includes any axis inversion, so
+    on inverted axes the bracket and its text follow the on-screen orientation
+    (theta changes sign for an inverted y axis). Older versions ignored the
+    inversion and drew the mirrored bracket. This is intended too.
+    """
+
+    if bool_auto:
+        # transData reads the view limits directly, so bring any pending
+        # autoscaling (of both axes) up to date first
+        ax.get_xlim()
+
+        return ax.transData
+
+    else:
+        # the fast path for "equal" axes, transScale does not depend on the
+        # limits or the axes size, so none of them are looked at
+        return ax.transScale
+
+
+def _to_data(trans, arc_x, arc_y):
+    """
+    Move arcs built by _get_ax_trans' transform back to data coordinates, all in one transform call.
+    """
+
+    xy = trans.inverted().transform(np.column_stack([np.ravel(arc_x), np.ravel(arc_y)]))
+
+    return xy[:, 0].reshape(np.shape(arc_x)), xy[:, 1].reshape(np.shape(arc_y))
+
+
+@njit(cache=True, fastmath=True)
+def _curly_geom(pt1x, pt1y, pt2x, pt2y, k_r, n_arc):
+    """
+    The numeric part of curlyBrace_, free of any matplotlib objects.
+
+    The end points are given in the linear space from _get_ax_trans, e.g.,
+    pixels, and so are the arcs.
+
+    This is compiled with numba when it is installed.
+
+    Returns
+    -------
+    theta : float
+        The bracket angle in radians.
+
+    arc_x : (4, n_arc) ndarray
+        The x coordinates of arc1 to arc4, one arc per row.
+
+    arc_y : (4, n_arc) ndarray
+        The y coordinates of arc1 to arc4, one arc per row.
+    """
+
+    dx = pt2x - pt1x
+    dy = pt2y - pt1y
+
+    # calculate the angle
+    theta = math.atan2(dy, dx)
+
+    # calculate the radius of the arcs
+    r = math.hypot(dx, dy) * k_r
+
+    c_theta = math.cos(theta)
+    s_theta = math.sin(theta)
+
+    # arc1 centre
+    x11 = pt1x + r * c_theta
+    y11 = pt1y + r * s_theta
+
+    # arc2 centre
+    x22 = (pt2x + pt1x) / 2.0 - 2.0 * r * s_theta - r * c_theta
+    y22 = (pt2y + pt1y) / 2.0 + 2.0 * r * c_theta - r * s_theta
+
+    # arc3 centre
+    x33 = (pt2x + pt1x) / 2.0 - 2.0 * r * s_theta + r * c_theta
+    y33 = (pt2y + pt1y) / 2.0 + 2.0 * r * c_theta + r * s_theta
+
+    # arc4 centre
+    x44 = pt2x - r * c_theta
+    y44 = pt2y - r * s_theta
+
+    # sample the rotated quarter circle from theta to theta + pi/2. The angles
+    # are equally spaced, so the cos/sin pairs follow the angle-addition
+    # recurrence and only the first point and the step need any trig
+    dtheta = (math.pi / 2.0) / (n_arc - 1)
+    dc = math.cos(dtheta)
+    ds = math.sin(dtheta)
+
+    # one scratch buffer for everything: rows 0-3 are the x coordinates of the
+    # arcs, rows 4-7 the y coordinates and rows 8-9 the cos/sin template.
+    # All the arithmetic below is done in place on views of it
+    buf = np.empty((10, n_arc))
+
+    arc_x = buf[0:4]
+    arc_y = buf[4:8]
+
+    cq = buf[8]
+    sq = buf[9]
+
+    c = c_theta
+    s = s_theta
+
+    for i in range(0, n_arc):
+        cq[i] = c
+        sq[i] = s
+
+        c, s = c * dc - s * ds, s * dc + c * ds
+
+    # the four arcs are the same quarter circle shifted by multiples of pi/2,
+    # so derive them all from cq and sq by sign and axis swaps
+
+    # reversed views, running from theta + pi/2 back to theta
+    ct = cq[::-1]
+    st = sq[::-1]
+
+    # arc coordinates, one row per arc
+    arc_x[0] = st
+    arc_x[1] = sq
+    arc_x[2] = cq
+    arc_x[3] = ct
+
+    arc_y[0] = ct
+    arc_y[1] = cq
+    arc_y[2] = sq
+    arc_y[3] = st
+
+    # scale by the radius, with the signs of the shifted quarter circles
+    arc_x[0] *= -r
+    arc_x[1] *= r
+    arc_x[2] *= -r
+    arc_x[3] *= r
+
+    arc_y[0] *= r
+    arc_y[1] *= -r
+    arc_y[2] *= -r
+    arc_y[3] *= r
+
+    # move to the centres
+    arc_x[0] += x11
+    arc_x[1] += x22
+    arc_x[2] += x33
+    arc_x[3] += x44
+
+    arc_y[0] += y11
+    arc_y[1] += y22
+    arc_y[2] += y33
+    arc_y[3] += y44
+
+    return theta, arc_x, arc_y
+
+
+def _add_bracket_collection(ax, segs, kwargs):
+    """
+    Add the bracket segments to the axes as one LineCollection and queue an autoscale, as ax.plot does.
+    """
+
+    ax.add_collection(LineCollection(segs, **kwargs))
+
+    # older matplotlib only updates the data limits here, so queue the lazy
+    # autoscale ourselves rather than rescaling the view on every bracket
+    if not _MPL_LAZY_COLLECTION_AUTOSCALE:
+        ax._request_autoscale_view()
+
+
+def _curly_geom_batch(pt1x, pt1y, pt2x, pt2y, k_r, n_arc):
+    """
+    The same as _curly_geom, but for N brackets at once.
+
+    The end points are (N,) arrays, k_r and n_arc are scalars. All the
+    arithmetic is broadcast over N, and the quarter circle is built from one
+    shared cos/sin template of n_arc points rotated by each bracket angle.
+
+    Returns
+    -------
+    theta : (N,) ndarray
+        The bracket angles in radians.
+
+    arc_x : (N, 4, n_arc) ndarray
+        The x coordinates of arc1 to arc4 of every bracket.
+
+    arc_y : (N, 4, n_arc) ndarray
+        The y coordinates of arc1 to arc4 of every bracket.
+    """
+
+    dx = pt2x - pt1x
+    dy = pt2y - pt1y
+
+    # calculate the angles and the radii of the arcs
+    theta = np.arctan2(dy, dx)
+    r = np.hypot(dx, dy) * k_r
+
+    c_theta = np.cos(theta)
+    s_theta = np.sin(theta)
+
+    xm = (pt2x + pt1x) / 2.0 - 2.0 * r * s_theta
+    ym = (pt2y + pt1y) / 2.0 + 2.0 * r * c_theta
+
+    # arc centres, (N, 4)
+    cx = np.stack([pt1x + r * c_theta, xm - r * c_theta, xm + r * c_theta, pt2x - r * c_theta], axis=1)
+    cy = np.stack([pt1y + r * s_theta, ym - r * s_theta, ym + r * s_theta, pt2y - r * s_theta], axis=1)
+
+    # the quarter circle from theta to theta + pi/2 by the angle-addition
+    # formula, so the trig of the template is shared by all brackets.
+    # phi is symmetric about pi/4, so sin(phi) = cos(pi/2 - phi) is just the
+    # reversed view of cos(phi)
+    phi = np.linspace(0.0, np.pi / 2.0, n_arc)
+    c_phi = np.cos(phi)
+    s_phi = c_phi[::-1]
+
+    cq = c_theta[:, None] * c_phi - s_theta[:, None] * s_phi
+    sq = s_theta[:, None] * c_phi + c_theta[:, None] * s_phi
+
+    ct = cq[:, ::-1]
+    st = sq[:, ::-1]
+
+    # unit arc coordinates, (N, 4, n_arc)
+    ux = np.stack([-st, sq, -cq, ct], axis=1)
+    uy = np.stack([ct, -cq, -sq, st], axis=1)
+
+    # scale and move to the centres
+    arc_x = r[:, None, None] * ux + cx[:, :, None]
+    arc_y = r[:, None, None] * uy + cy[:, :, None]
+
+    return theta, arc_x, arc_y
+
+
+def _annotate(ax, x, y, theta, str_text, int_line_num, fontdict):
+    """
+    Put the annotation text of a bracket at its summit (x, y), rotated with the bracket angle theta.
+    """
+
+    int_line_num = int(int_line_num)
+
+    str_temp = "\n" * int_line_num
+
+    # convert radians to degree and within 0 to 360
+    ang = math.degrees(theta) % 360.0
+
+    # flip the text on upside-down brackets so it stays readable,
+    # brackets at exactly 90 or 270 degrees are not flipped
+    flip = 90.0 < ang < 270.0
+
+    rotation = ang + 180.0 if flip else ang
+
+    str_text = (str_temp + str_text) if flip else (str_text + str_temp)
+
+    # work on a copy, the caller's fontdict may be shared by several brackets
+    fontdict = dict(fontdict)
+
+    if "rotation" in fontdict:
+        rotation = fontdict.pop("rotation")
+
+    ha = fontdict.pop("ha", "center")
+    va = fontdict.pop("va", "center")
 
-    return ax_width, ax_height
+    ax.axes.text(x, y, str_text, ha=ha, va=va, rotation=rotation, fontdict=fontdict)
 
 
-def curlyBrace(fig, ax, p1, p2, k_r=0.1, bool_auto=True, str_text="", int_line_num=2, fontdict={}, **kwargs):
+def curlyBrace(fig, ax, p1, p2, k_r=0.1, bool_auto=True, str_text="", int_line_num=2, fontdict={}, int_arc_num=16, **kwargs):
     # def curlyBrace(fig, ax, p1, p2, k_r=0.1, bool_auto=True, str_text='', int_line_num=2, fontdict={}, **kwargs):
     """
     .. _curlyBrace :
@@ -123,6 +428,14 @@ def curlyBrace(fig, ax, p1, p2, k_r=0.1, bool_auto=True, str_text="", int_line_n
         If you do not set this to False when setting the axes aspect to "equal",
         the bracket will be in funny shape.
 
+        When it is off on log axes, the bracket is built in log10 units, as
+        matplotlib lays out log axes. Older versions used natural log units here,
+        so such brackets have a slightly different shape.
+
+        When it is on, inverted axes are taken into account: the bracket and the
+        text follow the on-screen orientation, so the returned theta changes sign
+        for an inverted y axis. Older versions drew the mirrored bracket.
+
         Default = True
 
     str_text : string
@@ -152,348 +465,221 @@ def curlyBrace(fig, ax, p1, p2, k_r=0.1, bool_auto=True, str_text="", int_line_n
 
         Default = empty dict
 
-    **kwargs : matplotlib line setting arguments
-        This allows the user to set the line arguments using named arguments that are
-        the same as in matplotlib.
+    int_arc_num : int
+        The number of points used to draw each of the four quarter-circle arcs of
+        the bracket.
+
+        The default is smooth at the usual figure sizes and DPIs. Raise it for
+        very large brackets or high DPI output.
+
+        It must be at least 2, otherwise a ValueError is raised.
+
+        Default = 16
+
+    **kwargs : matplotlib LineCollection setting arguments
+        This allows the user to set the line arguments using named arguments, e.g.,
+        color, lw, linestyle, alpha, zorder.
+
+        The bracket is drawn as a single LineCollection, so only LineCollection
+        properties are accepted. Line2D-only arguments that ax.plot takes, e.g.,
+        marker, raise an error.
 
     Returns
     -------
     theta : float
         The bracket angle in radians.
 
-    summit : list
-        The positions of the bracket summit.
+    summit : tuple
+        The positions of the bracket summit, (x, y).
 
-    arc1 : list of lists
-        arc1 positions.
+    arc1 : tuple of arrays
+        arc1 positions, (x, y).
 
-    arc2 : list of lists
-        arc2 positions.
+    arc2 : tuple of arrays
+        arc2 positions, (x, y).
 
-    arc3 : list of lists
-        arc3 positions.
+    arc3 : tuple of arrays
+        arc3 positions, (x, y).
 
-    arc4 : list of lists
-        arc4 positions.
+    arc4 : tuple of arrays
+        arc4 positions, (x, y).
 
     Reference
     ----------
     https://uk.mathworks.com/matlabcentral/fileexchange/38716-curly-brace-annotation
     """
 
-    pt1 = [None, None]
-    pt2 = [None, None]
+    int_arc_num = _check_arc_num(int_arc_num)
 
-    ax_width, ax_height = getAxSize(fig, ax)
+    # build the bracket in a linear space, e.g., pixels, so that the axes
+    # scales (log or not) are only dealt with by the matplotlib transforms
+    trans = _get_ax_trans(ax, bool_auto)
 
-    ax_xlim = list(ax.get_xlim())
-    ax_ylim = list(ax.get_ylim())
+    (pt1x, pt1y), (pt2x, pt2y) = trans.transform([[p1[0], p1[1]], [p2[0], p2[1]]])
 
-    # log scale consideration
-    if "log" in ax.get_xaxis().get_scale():
+    # everything is passed as plain floats so numba compiles the kernel only once
+    theta, arc_x, arc_y = _curly_geom(
+        float(pt1x), float(pt1y), float(pt2x), float(pt2y), float(k_r), int_arc_num
+    )
 
-        if p1[0] > 0.0:
-            pt1[0] = np.log(p1[0])
+    arc_x, arc_y = _to_data(trans, arc_x, arc_y)
 
-        elif p1[0] < 0.0:
-            pt1[0] = -np.log(abs(p1[0]))
-
-        else:
-            pt1[0] = 0.0
-
-        if p2[0] > 0.0:
-            pt2[0] = np.log(p2[0])
-
-        elif p2[0] < 0.0:
-            pt2[0] = -np.log(abs(p2[0]))
-
-        else:
-            pt2[0] = 0
+    arc1x, arc2x, arc3x, arc4x = arc_x
+    arc1y, arc2y, arc3y, arc4y = arc_y
 
-        for i in range(0, len(ax_xlim)):
+    # the arcs and the connecting lines go into one collection, so the whole
+    # bracket is a single artist
+    segs = [np.column_stack([arc_x[i], arc_y[i]]) for i in range(0, 4)]
 
-            if ax_xlim[i] > 0.0:
-                ax_xlim[i] = np.log(ax_xlim[i])
+    segs.append(np.array([[arc1x[-1], arc1y[-1]], [arc2x[0], arc2y[0]]]))
+    segs.append(np.array([[arc3x[-1], arc3y[-1]], [arc4x[0], arc4y[0]]]))
 
-            elif ax_xlim[i] < 0.0:
-                ax_xlim[i] = -np.log(abs(ax_xlim[i]))
+    _add_bracket_collection(ax, segs, kwargs)
 
-            else:
-                ax_xlim[i] = 0.0
+    summit = (arc2x[-1], arc2y[-1])
 
-    else:
-        pt1[0] = p1[0]
-        pt2[0] = p2[0]
-
-    if "log" in ax.get_yaxis().get_scale():
-
-        if p1[1] > 0.0:
-            pt1[1] = np.log(p1[1])
-
-        elif p1[1] < 0.0:
-            pt1[1] = -np.log(abs(p1[1]))
-
-        else:
-            pt1[1] = 0.0
-
-        if p2[1] > 0.0:
-            pt2[1] = np.log(p2[1])
-
-        elif p2[1] < 0.0:
-            pt2[1] = -np.log(abs(p2[1]))
-
-        else:
-            pt2[1] = 0.0
-
-        for i in range(0, len(ax_ylim)):
-
-            if ax_ylim[i] > 0.0:
-                ax_ylim[i] = np.log(ax_ylim[i])
-
-            elif ax_ylim[i] < 0.0:
-                ax_ylim[i] = -np.log(abs(ax_ylim[i]))
-
-            else:
-                ax_ylim[i] = 0.0
+    if str_text:
+        _annotate(ax, summit[0], summit[1], theta, str_text, int_line_num, fontdict)
 
     else:
-        pt1[1] = p1[1]
-        pt2[1] = p2[1]
-
-    # get the ratio of pixels/length
-    xscale = ax_width / abs(ax_xlim[1] - ax_xlim[0])
-    yscale = ax_height / abs(ax_ylim[1] - ax_ylim[0])
-
-    # this is to deal with 'equal' axes aspects
-    if bool_auto:
 
         pass
 
-    else:
-        xscale = 1.0
-        yscale = 1.0
-
-    # convert length to pixels,
-    # need to minus the lower limit to move the points back to the origin. Then add the limits back on end.
-    pt1[0] = (pt1[0] - ax_xlim[0]) * xscale
-    pt1[1] = (pt1[1] - ax_ylim[0]) * yscale
-    pt2[0] = (pt2[0] - ax_xlim[0]) * xscale
-    pt2[1] = (pt2[1] - ax_ylim[0]) * yscale
-
-    # calculate the angle
-    theta = np.arctan2(pt2[1] - pt1[1], pt2[0] - pt1[0])
-
-    # calculate the radius of the arcs
-    r = np.hypot(pt2[0] - pt1[0], pt2[1] - pt1[1]) * k_r
+    return theta, summit, (arc1x, arc1y), (arc2x, arc2y), (arc3x, arc3y), (arc4x, arc4y)
 
-    # arc1 centre
-    x11 = pt1[0] + r * np.cos(theta)
-    y11 = pt1[1] + r * np.sin(theta)
 
-    # arc2 centre
-    x22 = (pt2[0] + pt1[0]) / 2.0 - 2.0 * r * np.sin(theta) - r * np.cos(theta)
-    y22 = (pt2[1] + pt1[1]) / 2.0 + 2.0 * r * np.cos(theta) - r * np.sin(theta)
-
-    # arc3 centre
-    x33 = (pt2[0] + pt1[0]) / 2.0 - 2.0 * r * np.sin(theta) + r * np.cos(theta)
-    y33 = (pt2[1] + pt1[1]) / 2.0 + 2.0 * r * np.cos(theta) + r * np.sin(theta)
-
-    # arc4 centre
-    x44 = pt2[0] - r * np.cos(theta)
-    y44 = pt2[1] - r * np.sin(theta)
-
-    # prepare the rotated
-    q = np.linspace(theta, theta + np.pi / 2.0, 50)
-
-    # reverse q
-    # t = np.flip(q) # this command is not supported by lower version of numpy
-    t = q[::-1]
-
-    # arc coordinates
-    arc1x = r * np.cos(t + np.pi / 2.0) + x11
-    arc1y = r * np.sin(t + np.pi / 2.0) + y11
-
-    arc2x = r * np.cos(q - np.pi / 2.0) + x22
-    arc2y = r * np.sin(q - np.pi / 2.0) + y22
-
-    arc3x = r * np.cos(q + np.pi) + x33
-    arc3y = r * np.sin(q + np.pi) + y33
-
-    arc4x = r * np.cos(t) + x44
-    arc4y = r * np.sin(t) + y44
-
-    # convert back to the axis coordinates
-    arc1x = arc1x / xscale + ax_xlim[0]
-    arc2x = arc2x / xscale + ax_xlim[0]
-    arc3x = arc3x / xscale + ax_xlim[0]
-    arc4x = arc4x / xscale + ax_xlim[0]
+def curlyBraces(fig, ax, P1, P2, k_r=0.1, bool_auto=True, str_text="", int_line_num=2, fontdict={}, int_arc_num=16, **kwargs):
+    """
+    .. _curlyBraces :
 
-    arc1y = arc1y / yscale + ax_ylim[0]
-    arc2y = arc2y / yscale + ax_ylim[0]
-    arc3y = arc3y / yscale + ax_ylim[0]
-    arc4y = arc4y / yscale + ax_ylim[0]
+    Plot N optionally annotated curly brackets on the given axes of the given figure in one go.
 
-    # log scale consideration
-    if "log" in ax.get_xaxis().get_scale():
+    This is the batched version of curlyBrace_. The geometry of all brackets is
+    calculated together and all of them are drawn as one LineCollection, which
+    is much faster than calling curlyBrace_ in a loop when there are many brackets.
 
-        for i in range(0, len(arc1x)):
+    Parameters
+    ----------
+    fig : matplotlib figure object
+        The of the target axes.
 
-            if arc1x[i] > 0.0:
-                arc1x[i] = np.exp(arc1x[i])
+    ax : matplotlib axes object
+        The target axes.
 
-            elif arc1x[i] < 0.0:
-                arc1x[i] = -np.exp(abs(arc1x[i]))
+    P1 : (N, 2) numeric array
+        The coordinates of the starting points.
 
-            else:
-                arc1x[i] = 0.0
+    P2 : (N, 2) numeric array
+        The coordinates of the end points. It must have the same shape as P1,
+        otherwise a ValueError is raised.
 
-        for i in range(0, len(arc2x)):
+    k_r : float
+        The same as in curlyBrace_, shared by all brackets.
 
-            if arc2x[i] > 0.0:
-                arc2x[i] = np.exp(arc2x[i])
+    bool_auto : boolean
+        The same as in curlyBrace_.
 
-            elif arc2x[i] < 0.0:
-                arc2x[i] = -np.exp(abs(arc2x[i]))
+        Default = True
 
-            else:
-                arc2x[i] = 0.0
+    str_text : string or list of N strings
+        The annotation text of the brackets. A single string is used for every
+        bracket. A list must have one string per bracket, otherwise a ValueError
+        is raised. Empty strings are not drawn.
 
-        for i in range(0, len(arc3x)):
+        Default = empty string (no annotation)
 
-            if arc3x[i] > 0.0:
-                arc3x[i] = np.exp(arc3x[i])
+    int_line_num : int
+        The same as in curlyBrace_.
 
-            elif arc3x[i] < 0.0:
-                arc3x[i] = -np.exp(abs(arc3x[i]))
+        Default = 2
 
-            else:
-                arc3x[i] = 0.0
+    fontdict : dictionary
+        The same as in curlyBrace_, shared by all annotations.
 
-        for i in range(0, len(arc4x)):
+        Default = empty dict
 
-            if arc4x[i] > 0.0:
-                arc4x[i] = np.exp(arc4x[i])
+    int_arc_num : int
+        The same as in curlyBrace_, at least 2.
 
-            elif arc4x[i] < 0.0:
-                arc4x[i] = -np.exp(abs(arc4x[i]))
+        Default = 16
 
-            else:
-                arc4x[i] = 0.0
+    **kwargs : matplotlib LineCollection setting arguments
+        The same as in curlyBrace_, passed on to the LineCollection of all brackets.
+        Only LineCollection properties are accepted.
 
-    else:
+        The collection holds 6 * N segments: the 4 arcs of every bracket, followed
+        by the 2 connecting lines of every bracket. List-valued properties are
+        applied per segment in that order, so a list with one colour per bracket
+        does not line up with the brackets. Use one curlyBraces call per style
+        instead.
 
-        pass
+    Returns
+    -------
+    theta : (N,) ndarray
+        The bracket angles in radians.
 
-    if "log" in ax.get_yaxis().get_scale():
+    summit : (N, 2) ndarray
+        The positions of the bracket summits.
 
-        for i in range(0, len(arc1y)):
+    arc_x : (N, 4, int_arc_num) ndarray
+        The x positions of arc1 to arc4 of every bracket.
 
-            if arc1y[i] > 0.0:
-                arc1y[i] = np.exp(arc1y[i])
+    arc_y : (N, 4, int_arc_num) ndarray
+        The y positions of arc1 to arc4 of every bracket.
+    """
 
-            elif arc1y[i] < 0.0:
-                arc1y[i] = -np.exp(abs(arc1y[i]))
+    int_arc_num = _check_arc_num(int_arc_num)
 
-            else:
-                arc1y[i] = 0.0
+    P1 = np.asarray(P1, dtype=float).reshape(-1, 2)
+    P2 = np.asarray(P2, dtype=float).reshape(-1, 2)
 
-        for i in range(0, len(arc2y)):
+    if P1.shape != P2.shape:
+        raise ValueError("P1 and P2 must have the same shape, got %s and %s" % (P1.shape, P2.shape))
 
-            if arc2y[i] > 0.0:
-                arc2y[i] = np.exp(arc2y[i])
+    int_num = len(P1)
 
-            elif arc2y[i] < 0.0:
-                arc2y[i] = -np.exp(abs(arc2y[i]))
+    trans = _get_ax_trans(ax, bool_auto)
 
-            else:
-                arc2y[i] = 0.0
+    P1 = trans.transform(P1)
+    P2 = trans.transform(P2)
 
-        for i in range(0, len(arc3y)):
+    theta, arc_x, arc_y = _curly_geom_batch(P1[:, 0], P1[:, 1], P2[:, 0], P2[:, 1], k_r, int_arc_num)
 
-            if arc3y[i] > 0.0:
-                arc3y[i] = np.exp(arc3y[i])
+    arc_x, arc_y = _to_data(trans, arc_x, arc_y)
 
-            elif arc3y[i] < 0.0:
-                arc3y[i] = -np.exp(abs(arc3y[i]))
+    # (N, 4, n, 2) arcs and (N, 2, 2, 2) connecting lines, all in one collection
+    arcs = np.stack([arc_x, arc_y], axis=-1)
 
-            else:
-                arc3y[i] = 0.0
+    lines = np.stack(
+        [
+            np.stack([arcs[:, 0, -1], arcs[:, 1, 0]], axis=1),
+            np.stack([arcs[:, 2, -1], arcs[:, 3, 0]], axis=1),
+        ],
+        axis=1,
+    )
 
-        for i in range(0, len(arc4y)):
+    segs = list(arcs.reshape(-1, int_arc_num, 2)) + list(lines.reshape(-1, 2, 2))
 
-            if arc4y[i] > 0.0:
-                arc4y[i] = np.exp(arc4y[i])
+    _add_bracket_collection(ax, segs, kwargs)
 
-            elif arc4y[i] < 0.0:
-                arc4y[i] = -np.exp(abs(arc4y[i]))
+    summit = arcs[:, 1, -1].copy()
 
-            else:
-                arc4y[i] = 0.0
+    if isinstance(str_text, str):
+        str_text = [str_text] * int_num
 
     else:
+        str_text = list(str_text)
 
-        pass
-
-    # plot arcs
-    ax.plot(arc1x, arc1y, **kwargs)
-    ax.plot(arc2x, arc2y, **kwargs)
-    ax.plot(arc3x, arc3y, **kwargs)
-    ax.plot(arc4x, arc4y, **kwargs)
-
-    # plot lines
-    ax.plot([arc1x[-1], arc2x[1]], [arc1y[-1], arc2y[1]], **kwargs)
-    ax.plot([arc3x[-1], arc4x[1]], [arc3y[-1], arc4y[1]], **kwargs)
-
-    summit = [arc2x[-1], arc2y[-1]]
-
-    if str_text:
-        int_line_num = int(int_line_num)
+        if len(str_text) != int_num:
+            raise ValueError("str_text must be a string or a list of %d strings, got %d" % (int_num, len(str_text)))
 
-        str_temp = "\n" * int_line_num
+    for i in range(0, int_num):
 
-        # convert radians to degree and within 0 to 360
-        ang = np.degrees(theta) % 360.0
-
-        if (ang >= 0.0) and (ang <= 90.0):
-            rotation = ang
-
-            str_text = str_text + str_temp
-
-        if (ang > 90.0) and (ang < 270.0):
-            rotation = ang + 180.0
-
-            str_text = str_temp + str_text
-
-        elif (ang >= 270.0) and (ang <= 360.0):
-            rotation = ang
-
-            str_text = str_text + str_temp
+        if str_text[i]:
+            _annotate(ax, summit[i, 0], summit[i, 1], theta[i], str_text[i], int_line_num, fontdict)
 
         else:
-            rotation = ang
-
-        if "rotation" in fontdict:
-            rotation = fontdict["rotation"]
-            del fontdict["rotation"]
-        if "ha" in fontdict:
-            ha = fontdict["ha"]
-            del fontdict["ha"]
-        else:
-            ha = "center"
-        if "va" in fontdict:
-            va = fontdict["va"]
-            del fontdict["va"]
-        else:
-            va = "center"
-
-        ax.axes.text(arc2x[-1], arc2y[-1], str_text, ha=ha, va=va, rotation=rotation, fontdict=fontdict)
-    else:
-
-        pass
 
-    arc1 = [arc1x, arc1y]
-    arc2 = [arc2x, arc2y]
-    arc3 = [arc3x, arc3y]
-    arc4 = [arc4x, arc4y]
+            pass
 
-    return theta, summit, arc1, arc2, arc3, arc4
+    return theta, summit, arc_x, arc_y
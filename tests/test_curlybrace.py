@@ -0,0 +1,223 @@
+import math
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from curlybrace.curlybrace import _curly_geom, _curly_geom_batch, curlyBrace, curlyBraces
+
+
+def _reference_geom(pt1, pt2, k_r, n_arc):
+    # the bracket geometry as it was written before the kernel was optimised
+    theta = np.arctan2(pt2[1] - pt1[1], pt2[0] - pt1[0])
+    r = np.hypot(pt2[0] - pt1[0], pt2[1] - pt1[1]) * k_r
+
+    x11 = pt1[0] + r * np.cos(theta)
+    y11 = pt1[1] + r * np.sin(theta)
+
+    x22 = (pt2[0] + pt1[0]) / 2.0 - 2.0 * r * np.sin(theta) - r * np.cos(theta)
+    y22 = (pt2[1] + pt1[1]) / 2.0 + 2.0 * r * np.cos(theta) - r * np.sin(theta)
+
+    x33 = (pt2[0] + pt1[0]) / 2.0 - 2.0 * r * np.sin(theta) + r * np.cos(theta)
+    y33 = (pt2[1] + pt1[1]) / 2.0 + 2.0 * r * np.cos(theta) + r * np.sin(theta)
+
+    x44 = pt2[0] - r * np.cos(theta)
+    y44 = pt2[1] - r * np.sin(theta)
+
+    q = np.linspace(theta, theta + np.pi / 2.0, n_arc)
+    t = q[::-1]
+
+    arc_x = np.array([
+        r * np.cos(t + np.pi / 2.0) + x11,
+        r * np.cos(q - np.pi / 2.0) + x22,
+        r * np.cos(q + np.pi) + x33,
+        r * np.cos(t) + x44,
+    ])
+    arc_y = np.array([
+        r * np.sin(t + np.pi / 2.0) + y11,
+        r * np.sin(q - np.pi / 2.0) + y22,
+        r * np.sin(q + np.pi) + y33,
+        r * np.sin(t) + y44,
+    ])
+
+    return theta, arc_x, arc_y
+
+
+POINTS = [
+    ((0.0, 0.0), (300.0, 0.0)),
+    ((300.0, 0.0), (0.0, 0.0)),
+    ((12.5, 40.0), (210.0, -175.0)),
+    ((100.0, 100.0), (100.0, 400.0)),
+]
+
+
+@pytest.mark.parametrize("pt1, pt2", POINTS)
+@pytest.mark.parametrize("n_arc", [2, 16, 50])
+def test_curly_geom_matches_reference(pt1, pt2, n_arc):
+    theta, arc_x, arc_y = _curly_geom(pt1[0], pt1[1], pt2[0], pt2[1], 0.05, n_arc)
+    ref_theta, ref_x, ref_y = _reference_geom(pt1, pt2, 0.05, n_arc)
+
+    assert theta == pytest.approx(ref_theta, abs=1e-12)
+    assert arc_x.shape == (4, n_arc)
+    assert arc_y.shape == (4, n_arc)
+    np.testing.assert_allclose(arc_x, ref_x, rtol=0.0, atol=1e-9)
+    np.testing.assert_allclose(arc_y, ref_y, rtol=0.0, atol=1e-9)
+
+
+def test_curly_geom_is_compiled_with_numba():
+    pytest.importorskip("numba")
+
+    # a numba dispatcher keeps the original function as py_func
+    assert hasattr(_curly_geom, "py_func")
+
+
+@pytest.mark.parametrize("n_arc", [2, 16, 50])
+def test_curly_geom_batch_matches_curly_geom(n_arc):
+    P1 = np.array([p1 for p1, _ in POINTS])
+    P2 = np.array([p2 for _, p2 in POINTS])
+
+    theta, arc_x, arc_y = _curly_geom_batch(P1[:, 0], P1[:, 1], P2[:, 0], P2[:, 1], 0.05, n_arc)
+
+    for i, (pt1, pt2) in enumerate(POINTS):
+        ref_theta, ref_x, ref_y = _curly_geom(pt1[0], pt1[1], pt2[0], pt2[1], 0.05, n_arc)
+
+        assert theta[i] == pytest.approx(ref_theta, abs=1e-12)
+        np.testing.assert_allclose(arc_x[i], ref_x, rtol=0.0, atol=1e-9)
+        np.testing.assert_allclose(arc_y[i], ref_y, rtol=0.0, atol=1e-9)
+
+
+def _make_axes(xscale="linear", yscale="linear"):
+    fig, ax = plt.subplots(figsize=(8, 6), dpi=100)
+    ax.set_xscale(xscale)
+    ax.set_yscale(yscale)
+
+    x = np.linspace(0.5, 100.0, 50)
+    ax.plot(x, 2.0 * x)
+
+    # keep the limits fixed, so that earlier brackets do not move later ones
+    ax.set_autoscale_on(False)
+
+    return fig, ax
+
+
+@pytest.mark.parametrize(
+    "xscale, yscale, bool_auto",
+    [("linear", "linear", True), ("linear", "log", True), ("log", "log", True), ("linear", "linear", False)],
+)
+def test_curly_braces_matches_curly_brace(xscale, yscale, bool_auto):
+    fig, ax = _make_axes(xscale, yscale)
+
+    P1 = np.array([[20.0, 10.69], [5.0, 40.0], [60.0, 150.0], [1.0, 1.0]])
+    P2 = np.array([[80.0, 151.6], [50.0, 45.0], [30.0, 20.0], [90.0, 3.0]])
+
+    theta, summit, arc_x, arc_y = curlyBraces(fig, ax, P1, P2, 0.05, bool_auto=bool_auto, str_text="a")
+
+    for i in range(0, len(P1)):
+        ref_theta, ref_summit, *ref_arcs = curlyBrace(fig, ax, P1[i], P2[i], 0.05, bool_auto=bool_auto, str_text="a")
+
+        assert theta[i] == pytest.approx(ref_theta, abs=1e-12)
+        np.testing.assert_allclose(summit[i], ref_summit, rtol=1e-12, atol=1e-9)
+
+        for j in range(0, 4):
+            np.testing.assert_allclose(arc_x[i, j], ref_arcs[j][0], rtol=1e-12, atol=1e-9)
+            np.testing.assert_allclose(arc_y[i, j], ref_arcs[j][1], rtol=1e-12, atol=1e-9)
+
+    plt.close(fig)
+
+
+def test_curly_braces_str_text_length():
+    fig, ax = _make_axes()
+
+    with pytest.raises(ValueError):
+        curlyBraces(fig, ax, [[0.0, 0.0], [1.0, 1.0]], [[1.0, 0.0], [2.0, 1.0]], str_text=["a"])
+
+    plt.close(fig)
+
+
+def test_curly_braces_point_shapes():
+    fig, ax = _make_axes()
+
+    with pytest.raises(ValueError):
+        curlyBraces(fig, ax, [[0.0, 0.0]], [[1.0, 0.0], [2.0, 1.0]])
+
+    with pytest.raises(ValueError):
+        curlyBraces(fig, ax, [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]], [[1.0, 0.0], [2.0, 1.0]])
+
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("n_arc", [2, 3, 16])
+def test_connecting_lines_join_arcs_at_tangent_points(n_arc):
+    fig, ax = _make_axes()
+
+    p1, p2 = [20.0, 10.0], [80.0, 150.0]
+
+    _, _, arc1, arc2, arc3, arc4 = curlyBrace(fig, ax, p1, p2, 0.1, int_arc_num=n_arc)
+    single_segs = ax.collections[-1].get_segments()
+
+    _, _, arc_x, arc_y = curlyBraces(fig, ax, [p1], [p2], 0.1, int_arc_num=n_arc)
+    batch_segs = ax.collections[-1].get_segments()
+
+    batch_arcs = [(arc_x[0, j], arc_y[0, j]) for j in range(0, 4)]
+
+    # compare in pixels, where the lines run parallel to the end points
+    dx, dy = np.subtract(*ax.transData.transform([p2, p1]))
+
+    for segs, arcs in ((single_segs, (arc1, arc2, arc3, arc4)), (batch_segs, batch_arcs)):
+
+        # segments 4 and 5 of the collection are the two straight lines
+        for seg, arc_a, arc_b in ((segs[4], arcs[0], arcs[1]), (segs[5], arcs[2], arcs[3])):
+            np.testing.assert_allclose(seg[0], [arc_a[0][-1], arc_a[1][-1]])
+            np.testing.assert_allclose(seg[1], [arc_b[0][0], arc_b[1][0]])
+
+            (x0, y0), (x1, y1) = ax.transData.transform(seg)
+            lx, ly = x1 - x0, y1 - y0
+
+            # arc_a's end, arc_b's start and the line are collinear with the bracket direction
+            assert abs(lx * dy - ly * dx) <= 1e-9 * math.hypot(lx, ly) * math.hypot(dx, dy)
+
+    plt.close(fig)
+
+
+def test_int_arc_num_below_2():
+    fig, ax = _make_axes()
+
+    with pytest.raises(ValueError):
+        curlyBrace(fig, ax, [0.0, 0.0], [1.0, 1.0], int_arc_num=1)
+
+    with pytest.raises(ValueError):
+        curlyBraces(fig, ax, [[0.0, 0.0]], [[1.0, 1.0]], int_arc_num=0)
+
+    plt.close(fig)
+
+
+def test_log_axis_below_1():
+    fig, ax = plt.subplots(figsize=(8, 6), dpi=100)
+    ax.set_yscale("log")
+    ax.plot([0.0, 10.0], [0.001, 1.0])
+    ax.set_autoscale_on(False)
+
+    p1, p2 = [2.0, 0.01], [8.0, 0.5]
+    k_r = 0.1
+
+    _, _, *arcs = curlyBrace(fig, ax, p1, p2, k_r)
+
+    arc_y = np.concatenate([arc[1] for arc in arcs])
+
+    # the old signed log mirrored values below 1 to negatives
+    assert np.all(arc_y > 0.0)
+
+    # in pixels the bracket sticks out from its chord by 2 r, r = k_r * chord length
+    (x1, y1), (x2, y2) = ax.transData.transform([p1, p2])
+    pad = 2.0 * k_r * math.hypot(x2 - x1, y2 - y1)
+
+    y_pix = ax.transData.transform(np.column_stack([np.zeros_like(arc_y), arc_y]))[:, 1]
+
+    assert np.all(y_pix >= min(y1, y2) - pad - 1e-9)
+    assert np.all(y_pix <= max(y1, y2) + pad + 1e-9)
+
+    plt.close(fig)